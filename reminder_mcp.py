@@ -14,54 +14,632 @@ macOSのリマインダーアプリと連携するMCPサーバーを提供する
 - 現在時刻の取得 (新機能)
 """
 import os
+import asyncio
+import atexit
+import concurrent.futures
 import subprocess
+import threading
+import time
 import sys
 import json
+import re
+import logging
 import datetime
-from typing import Optional, Dict, List, Any
-from mcp.server.fastmcp import FastMCP
+import functools
+import importlib.util
+from typing import Dict, List
 
-def run_applescript(script: str):
+logger = logging.getLogger(__name__)
+
+# EventKit (PyObjC) が利用できる場合はリマインダー・カレンダーへ直接アクセスする。
+# 環境変数 REMINDER_MCP_BACKEND=applescript でAppleScript経由の実装に切り替えられる。
+# PyObjCのブリッジは読み込みが重いため、ここでは存在確認だけを行い、最初の使用時にインポートする。
+USE_EVENTKIT = importlib.util.find_spec("EventKit") is not None and os.environ.get("REMINDER_MCP_BACKEND", "eventkit") != "applescript"
+
+# 常駐させたosascriptプロセス上で動かすJXAドライバ。
+# 標準入力から1行1件のJSON（AppleScriptのソースと引数）を受け取り、
+# NSAppleScriptで実行した結果を1行のJSONとして標準出力へ返す。
+# コンパイル済みのスクリプトはソースごとに保持し、2回目以降は再コンパイルしない。
+# 引数はrunイベントの直接パラメータとして渡し、スクリプト側では on run argv で受け取る。
+# osascript -i は1行ずつコンパイルするため複数行のtellブロックを扱えず、
+# こちらの方式でプロセスを使い回す。
+_DRIVER_SCRIPT = r'''
+ObjC.import("Foundation");
+var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+var buffer = "";
+
+function readLine() {
+    while (true) {
+        var i = buffer.indexOf("\n");
+        if (i >= 0) {
+            var line = buffer.slice(0, i);
+            buffer = buffer.slice(i + 1);
+            return line;
+        }
+        var data = stdin.availableData;
+        if (data.length == 0) {
+            return null;
+        }
+        buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    }
+}
+
+var compiled = {};
+
+function runEvent(args) {
+    var argv = $.NSAppleEventDescriptor.listDescriptor;
+    for (var i = 0; i < args.length; i++) {
+        argv.insertDescriptorAtIndex($.NSAppleEventDescriptor.descriptorWithString(args[i]), i + 1);
+    }
+    // kCoreEventClass ('aevt') / kAEOpenApplication ('oapp')
+    var event = $.NSAppleEventDescriptor.appleEventWithEventClassEventIDTargetDescriptorReturnIDTransactionID(
+        0x61657674, 0x6f617070, $.NSAppleEventDescriptor.currentProcessDescriptor, -1, 0);
+    // keyDirectObject ('----')
+    event.setParamDescriptorForKeyword(argv, 0x2d2d2d2d);
+    return event;
+}
+
+// osascript -e と同じく、リストは ", " で連結した文字列として返す
+function toText(desc) {
+    var s = desc.stringValue;
+    if (!s.isNil()) {
+        return s.js;
+    }
+    var items = [];
+    for (var i = 1; i <= desc.numberOfItems; i++) {
+        items.push(toText(desc.descriptorAtIndex(i)));
+    }
+    return items.join(", ");
+}
+
+while (true) {
+    var line = readLine();
+    if (line === null) {
+        break;
+    }
+    var request = JSON.parse(line);
+    var error = Ref();
+    var script = compiled[request.source];
+    var desc = $();
+    if (script === undefined) {
+        script = $.NSAppleScript.alloc.initWithSource(request.source);
+        if (script.compileAndReturnError(error)) {
+            compiled[request.source] = script;
+        } else {
+            script = null;
+        }
+    }
+    if (script !== null) {
+        if (request.args.length > 0) {
+            desc = script.executeAppleEventError(runEvent(request.args), error);
+        } else {
+            desc = script.executeAndReturnError(error);
+        }
+    }
+    var response;
+    if (desc.isNil()) {
+        var info = ObjC.deepUnwrap(error[0]) || {};
+        response = {ok: false, error: String(info.NSAppleScriptErrorMessage || JSON.stringify(info))};
+    } else {
+        response = {ok: true, result: toText(desc)};
+    }
+    stdout.writeData($(JSON.stringify(response) + "\n").dataUsingEncoding($.NSUTF8StringEncoding));
+}
+'''
+
+_OSASCRIPT = "/usr/bin/osascript"
+
+class AppleScriptSession:
+    """
+    常駐させたosascriptプロセスでAppleScriptを実行するセッション。
+
+    呼び出しごとにosascriptを起動するコストを避けるため、
+    最初の実行時にプロセスを起動し、以降はそのプロセスを使い回す。
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """osascriptプロセスを起動する。"""
+        # subprocessがfork()ではなくposix_spawn()を使えるよう、実行ファイルを絶対パスで指定し
+        # close_fds=Falseとする (Pythonが作成するパイプは元々子プロセスに継承されない)
+        self._proc = subprocess.Popen(
+            [_OSASCRIPT, '-l', 'JavaScript', '-e', _DRIVER_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            text=True, encoding='utf-8', bufsize=1, close_fds=False)
+
+    def run(self, script: str, args=()):
+        """
+        AppleScriptを実行し、結果を返す。
+
+        Args:
+            script: 実行するAppleScriptのコード
+            args: スクリプトの on run argv に渡す引数
+
+        Returns:
+            AppleScriptの実行結果 (エラー時はNone)
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self.start()
+            try:
+                self._proc.stdin.write(json.dumps({"source": script, "args": [str(a) for a in args]}) + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except OSError as e:
+                line = ""
+                logger.error("Error communicating with osascript: %s", e)
+            if not line:
+                # プロセスが終了しているので、次回の呼び出しで起動し直す
+                self.close()
+                return None
+        response = json.loads(line)
+        if not response["ok"]:
+            logger.error("Error executing AppleScript: %s", response["error"])
+            return None
+        # 結果の前後に区切り文字 (0x1E/0x1F) が来ることがあるため、strip()しない
+        return response["result"]
+
+    def close(self):
+        """osascriptプロセスを終了する。"""
+        if self._proc is not None:
+            self._proc.terminate()
+            self._proc = None
+
+# 同時に実行するosascriptプロセスの上限
+# (多数のプロセスを同時に起動するとLaunchServicesが詰まるため制限する)
+_MAX_SESSIONS = 8
+_sessions = []
+_idle_sessions = []
+_sessions_semaphore = asyncio.Semaphore(_MAX_SESSIONS)
+
+def _close_sessions():
+    """起動したすべてのosascriptプロセスを終了する。"""
+    for session in _sessions:
+        session.close()
+
+atexit.register(_close_sessions)
+
+# サーバー起動時にあらかじめ起動しておくosascriptプロセスの数
+_WARM_SESSIONS = 2
+
+def warm_up_sessions(count: int = _WARM_SESSIONS):
+    """
+    osascriptプロセスをあらかじめ起動し、最初のツール呼び出しの待ち時間を減らす。
+
+    Args:
+        count: 起動するプロセスの数
+    """
+    for _ in range(count - len(_sessions)):
+        session = AppleScriptSession()
+        session.start()
+        _sessions.append(session)
+        _idle_sessions.append(session)
+
+async def run_applescript(script: str, *args):
     """
     AppleScriptを実行し、結果を返す関数。
 
+    スクリプトは常駐プロセス内で初回のみコンパイルされる。
+    値は文字列に埋め込まず、引数として渡して on run argv で受け取ること。
+    空いているセッションを使い、ブロッキングする入出力は別スレッドで行うため、
+    同時に呼び出されたツールの処理は最大 _MAX_SESSIONS 個まで並行して実行される。
+
     Args:
         script: 実行するAppleScriptのコード
+        *args: スクリプトに渡す引数
 
     Returns:
         AppleScriptの実行結果
     """
-    try:
-        result = subprocess.run(['osascript', '-e', script], 
-                               capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error executing AppleScript: {e.stderr}", file=sys.stderr)
+    async with _sessions_semaphore:
+        if _idle_sessions:
+            session = _idle_sessions.pop()
+        else:
+            session = AppleScriptSession()
+            _sessions.append(session)
+        try:
+            return await asyncio.to_thread(session.run, script, args)
+        finally:
+            _idle_sessions.append(session)
+
+# EventKit関連の関数
+# EventKit・NSDate・_storeは_get_store()の初回呼び出し時に設定する
+EventKit = None
+NSDate = None
+_store = None
+_access_granted = set()
+# EKEventStoreは専用の1スレッドからのみ操作する
+_ek_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="eventkit")
+
+def _get_store():
+    """
+    EventKitをインポートしてEKEventStoreを作成し、以降は同じものを返す。
+
+    Returns:
+        EKEventStore
+    """
+    global EventKit, NSDate, _store
+    if _store is None:
+        import EventKit
+        from Foundation import NSDate
+        _store = EventKit.EKEventStore.alloc().init()
+    return _store
+
+def _ek_call(func, *args):
+    """EKEventStoreを用意してからEventKitを操作する関数を呼び出す。"""
+    _get_store()
+    return func(*args)
+
+async def _run_eventkit(func, *args):
+    """
+    EventKitを操作する関数を専用スレッドで実行する。
+
+    Args:
+        func: 実行する関数
+        *args: 関数に渡す引数
+
+    Returns:
+        関数の戻り値
+    """
+    return await asyncio.get_running_loop().run_in_executor(_ek_executor, _ek_call, func, *args)
+
+def _ek_request_access(entity_type):
+    """
+    リマインダーまたはカレンダーへのアクセス権限を要求する。
+
+    Args:
+        entity_type: EKEntityTypeReminder または EKEntityTypeEvent
+
+    Returns:
+        アクセスが許可された場合はTrue
+    """
+    if entity_type in _access_granted:
+        return True
+    finished = threading.Event()
+    result = {"granted": False}
+
+    def handler(granted, error):
+        result["granted"] = bool(granted)
+        finished.set()
+
+    # macOS 14以降は完全アクセス用のAPIを使う
+    if entity_type == EventKit.EKEntityTypeReminder and hasattr(_store, "requestFullAccessToRemindersWithCompletion_"):
+        _store.requestFullAccessToRemindersWithCompletion_(handler)
+    elif entity_type == EventKit.EKEntityTypeEvent and hasattr(_store, "requestFullAccessToEventsWithCompletion_"):
+        _store.requestFullAccessToEventsWithCompletion_(handler)
+    else:
+        _store.requestAccessToEntityType_completion_(entity_type, handler)
+    finished.wait()
+    if result["granted"]:
+        _access_granted.add(entity_type)
+    else:
+        logger.error("Access to EventKit was denied")
+    return result["granted"]
+
+def _ek_fetch_reminders(predicate):
+    """
+    条件に一致するリマインダーを取得する。
+
+    Args:
+        predicate: EKEventStoreで作成した検索条件
+
+    Returns:
+        EKReminderのリスト
+    """
+    if not _ek_request_access(EventKit.EKEntityTypeReminder):
+        return []
+    finished = threading.Event()
+    reminders = []
+
+    def handler(result):
+        reminders.extend(result or [])
+        finished.set()
+
+    _store.fetchRemindersMatchingPredicate_completion_(predicate, handler)
+    finished.wait()
+    return reminders
+
+def _ek_find_reminder(name: str, incomplete_only: bool = False):
+    """
+    名前が一致する最初のリマインダーを取得する。
+
+    Args:
+        name: リマインダー名
+        incomplete_only: Trueの場合は未完了のリマインダーのみを対象とする
+
+    Returns:
+        EKReminder (見つからない場合はNone)
+    """
+    for r in _ek_fetch_reminders(_store.predicateForRemindersInCalendars_(None)):
+        if r.title() == name and not (incomplete_only and r.isCompleted()):
+            return r
+    return None
+
+def _ek_save_reminder(reminder):
+    """リマインダーを保存し、成功した場合はTrueを返す。"""
+    ok, error = _store.saveReminder_commit_error_(reminder, True, None)
+    if not ok:
+        logger.error("Error saving reminder: %s", error)
+    return bool(ok)
+
+def _ek_find_calendar(calendar_name: str):
+    """
+    名前が一致するイベント用カレンダーを取得する。
+
+    Args:
+        calendar_name: カレンダー名
+
+    Returns:
+        EKCalendar (見つからない場合はNone)
+    """
+    for c in _store.calendarsForEntityType_(EventKit.EKEntityTypeEvent):
+        if c.title() == calendar_name:
+            return c
+    return None
+
+def _ek_date(dt: datetime.datetime):
+    """datetimeをNSDateに変換する。"""
+    return NSDate.dateWithTimeIntervalSince1970_(dt.timestamp())
+
+def _ek_datetime(date):
+    """NSDateをdatetimeに変換する。"""
+    return datetime.datetime.fromtimestamp(date.timeIntervalSince1970())
+
+def _ek_list_reminders():
+    """EventKitで未完了のリマインダー名の一覧を取得する。"""
+    predicate = _store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(None, None, None)
+    return [r.title() for r in _ek_fetch_reminders(predicate)]
+
+def _ek_get(name: str):
+    """EventKitでリマインダーの詳細を取得する。"""
+    r = _ek_find_reminder(name)
+    if r is None:
         return None
+    return {"name": r.title(), "body": r.notes() or "", "completed": bool(r.isCompleted())}
+
+def _ek_done(name: str):
+    """EventKitでリマインダーを完了済みにする。"""
+    r = _ek_find_reminder(name, incomplete_only=True)
+    if r is None:
+        return False
+    r.setCompleted_(True)
+    return _ek_save_reminder(r)
+
+def _ek_delete(name: str):
+    """EventKitでリマインダーを削除する。"""
+    r = _ek_find_reminder(name)
+    if r is None:
+        return False
+    ok, error = _store.removeReminder_commit_error_(r, True, None)
+    if not ok:
+        logger.error("Error deleting reminder: %s", error)
+    return bool(ok)
+
+def _ek_update(old_name: str, new_name: str):
+    """EventKitでリマインダー名を更新する。"""
+    r = _ek_find_reminder(old_name)
+    if r is None:
+        return False
+    r.setTitle_(new_name)
+    return _ek_save_reminder(r)
+
+def _ek_add(name: str, body: str = ""):
+    """EventKitでデフォルトのリストにリマインダーを追加する。"""
+    if not _ek_request_access(EventKit.EKEntityTypeReminder):
+        return False
+    r = EventKit.EKReminder.reminderWithEventStore_(_store)
+    r.setTitle_(name)
+    r.setNotes_(body)
+    r.setCalendar_(_store.defaultCalendarForNewReminders())
+    return _ek_save_reminder(r)
+
+def _ek_reminders_by_name(incomplete_only: bool = False):
+    """全リマインダーを取得し、名前ごとに同名のリマインダーのリストを見つかった順に返す。"""
+    reminders = {}
+    for r in _ek_fetch_reminders(_store.predicateForRemindersInCalendars_(None)):
+        if not (incomplete_only and r.isCompleted()):
+            reminders.setdefault(r.title(), []).append(r)
+    return reminders
+
+def _ek_pop_reminder(reminders, name):
+    """同名のリマインダーのうち、まだ処理していない最初の1件を取り出す。"""
+    matches = reminders.get(name)
+    return matches.pop(0) if matches else None
+
+def _ek_commit():
+    """
+    保留中の変更をまとめて保存する。
+
+    失敗した場合は保留中の変更を破棄し、後の保存で適用されないようにする。
+    """
+    ok, error = _store.commit_(None)
+    if not ok:
+        logger.error("Error committing changes: %s", error)
+        _store.reset()
+    return bool(ok)
+
+def _ek_get_many(names):
+    """EventKitで全リマインダーを1回だけ取得し、複数のリマインダーの詳細を返す。"""
+    reminders = _ek_reminders_by_name()
+    results = {}
+    for name in names:
+        r = reminders[name][0] if name in reminders else None
+        results[name] = None if r is None else {"name": r.title(), "body": r.notes() or "", "completed": bool(r.isCompleted())}
+    return results
+
+def _ek_done_many(names):
+    """EventKitで複数のリマインダーを完了済みにし、最後にまとめて保存する。"""
+    reminders = _ek_reminders_by_name(incomplete_only=True)
+    results = []
+    for name in names:
+        r = _ek_pop_reminder(reminders, name)
+        if r is not None:
+            r.setCompleted_(True)
+        results.append(r is not None and bool(_store.saveReminder_commit_error_(r, False, None)[0]))
+    if any(results) and not _ek_commit():
+        return [False] * len(names)
+    return results
+
+def _ek_delete_many(names):
+    """EventKitで複数のリマインダーを削除し、最後にまとめて保存する。"""
+    reminders = _ek_reminders_by_name()
+    results = []
+    for name in names:
+        r = _ek_pop_reminder(reminders, name)
+        results.append(r is not None and bool(_store.removeReminder_commit_error_(r, False, None)[0]))
+    if any(results) and not _ek_commit():
+        return [False] * len(names)
+    return results
+
+def _ek_update_many(updates):
+    """EventKitで複数のリマインダー名を更新し、最後にまとめて保存する。"""
+    reminders = _ek_reminders_by_name()
+    results = []
+    for old_name, new_name in updates.items():
+        r = _ek_pop_reminder(reminders, old_name)
+        if r is not None:
+            r.setTitle_(new_name)
+        results.append(r is not None and bool(_store.saveReminder_commit_error_(r, False, None)[0]))
+    if any(results) and not _ek_commit():
+        return [False] * len(updates)
+    return results
+
+def _ek_get_calendars():
+    """EventKitでイベント用カレンダー名の一覧を取得する。"""
+    if not _ek_request_access(EventKit.EKEntityTypeEvent):
+        return []
+    return [c.title() for c in _store.calendarsForEntityType_(EventKit.EKEntityTypeEvent)]
+
+def _ek_create_calendar_event(title, start_date_obj, end_date_obj, calendar_name, location, notes):
+    """EventKitでカレンダーにイベントを作成する。"""
+    if not _ek_request_access(EventKit.EKEntityTypeEvent):
+        return False
+    calendar = _ek_find_calendar(calendar_name)
+    if calendar is None:
+        logger.error("Calendar not found: %s", calendar_name)
+        return False
+    event = EventKit.EKEvent.eventWithEventStore_(_store)
+    event.setTitle_(title)
+    event.setStartDate_(_ek_date(start_date_obj.replace(second=0, microsecond=0)))
+    event.setEndDate_(_ek_date(end_date_obj.replace(second=0, microsecond=0)))
+    event.setLocation_(location)
+    event.setNotes_(notes)
+    event.setCalendar_(calendar)
+    ok, error = _store.saveEvent_span_error_(event, EventKit.EKSpanThisEvent, None)
+    if not ok:
+        logger.error("Error saving event: %s", error)
+    return bool(ok)
+
+def _ek_get_calendar_events(range_start, range_end, calendar_name):
+    """EventKitで指定した期間に始まるイベントを取得する。"""
+    if not _ek_request_access(EventKit.EKEntityTypeEvent):
+        return []
+    calendar = _ek_find_calendar(calendar_name)
+    if calendar is None:
+        return []
+    predicate = _store.predicateForEventsWithStartDate_endDate_calendars_(
+        _ek_date(range_start), _ek_date(range_end), [calendar])
+    events = []
+    for e in _store.eventsMatchingPredicate_(predicate):
+        start = _ek_datetime(e.startDate())
+        if not range_start <= start <= range_end:
+            continue
+        events.append({
+            "title": e.title() or "",
+            "start": start.isoformat(),
+            "end": _ek_datetime(e.endDate()).isoformat(),
+            "location": e.location() or ""
+        })
+    events.sort(key=lambda event: event["start"])
+    return events
+
+# 入力値の検証
+# 1行の値 (名前やタイトル) の最大文字数
+_MAX_TEXT_LENGTH = 1024
+_CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f]")
+# 本文やメモでは改行とタブを許可する
+_CONTROL_CHARS_MULTILINE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+def _validate_text(value: str, field: str, multiline: bool = False):
+    """
+    ツールに渡された文字列を検証する。
+
+    不正な値でスクリプトが失敗するとエージェントが再試行して呼び出しが増えるため、
+    実行前に理由を示して拒否する。制御文字は結果の区切り文字とも衝突する。
+
+    Args:
+        value: 検証する文字列
+        field: エラーメッセージに表示する項目名
+        multiline: Trueの場合は改行とタブを許可し、文字数を制限しない
+
+    Raises:
+        ValueError: 値が長すぎる場合、または制御文字を含む場合
+    """
+    if not multiline and len(value) > _MAX_TEXT_LENGTH:
+        raise ValueError(f"{field} must be at most {_MAX_TEXT_LENGTH} characters")
+    pattern = _CONTROL_CHARS_MULTILINE if multiline else _CONTROL_CHARS
+    if pattern.search(value):
+        raise ValueError(f"{field} must not contain control characters")
 
 # リマインダー関連の関数
-def list_reminders():
+# whose句はosascriptから実行すると極端に遅くなる場合があるため、
+# 名前などの一覧をまとめて取得し、このハンドラでスクリプト内で照合する。
+# completedListにmissing value以外を渡すと未完了のリマインダーのみを対象とする。
+# AppleScriptの文字列比較は既定で大文字・小文字を区別しないため、
+# EventKit版と同じく完全一致で照合するようconsidering caseで囲む。
+_FIND_INDEX_HANDLER = '''
+on findIndex(targetName, nameList, completedList)
+    considering case
+        repeat with i from 1 to count of nameList
+            if item i of nameList is targetName then
+                if completedList is missing value or item i of completedList is false then
+                    return i
+                end if
+            end if
+        end repeat
+    end considering
+    return 0
+end findIndex
+'''
+
+async def list_reminders():
     """
     未完了のリマインダー一覧を取得する。
 
     Returns:
         リマインダー名のリスト
     """
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_list_reminders)
     script = '''
     tell application "Reminders"
+        set nameList to name of every reminder
+        set completedList to completed of every reminder
         set remindersList to {}
-        repeat with r in (reminders whose completed is false)
-            set end of remindersList to name of r
+        repeat with i from 1 to count of nameList
+            if item i of completedList is false then
+                set end of remindersList to item i of nameList
+            end if
         end repeat
-        return remindersList
     end tell
+    -- 名前に ", " が含まれていても分割できるよう、区切り文字にUS (0x1F) を使う。
+    -- 名前が空のリマインダー1件だけの場合と0件の場合を区別できるよう、各名前の後ろにUSを付ける
+    if (count of remindersList) is 0 then
+        return ""
+    end if
+    set AppleScript's text item delimiters to (character id 31)
+    return (remindersList as string) & (character id 31)
     '''
-    result = run_applescript(script)
+    result = await run_applescript(script)
     if result:
-        return result.split(", ")
+        return result.split("\x1f")[:-1]
     return []
 
-def get(name: str):
+async def get(name: str):
     """
     特定のリマインダーの詳細を取得する。
 
@@ -71,24 +649,36 @@ def get(name: str):
     Returns:
         リマインダーの詳細情報
     """
-    script = f'''
-    tell application "Reminders"
-        set matchingReminders to (reminders whose name is "{name}")
-        if (count of matchingReminders) > 0 then
-            set r to item 1 of matchingReminders
-            return name of r & "," & (body of r as string) & "," & (completed of r as string)
-        else
-            return "not found"
-        end if
-    end tell
+    _validate_text(name, "name")
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_get, name)
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set i to my findIndex(item 1 of argv, nameList, missing value)
+            if i > 0 then
+                set r to reminder id (item i of (id of every reminder))
+                set reminderBody to body of r
+                if reminderBody is missing value then
+                    set reminderBody to ""
+                end if
+                -- 本文にカンマが含まれていても分割できるよう、区切り文字にUS (0x1F) を使う
+                return name of r & (character id 31) & reminderBody & (character id 31) & (completed of r as string)
+            else
+                return "not found"
+            end if
+        end tell
+    end run
     '''
-    result = run_applescript(script)
+    result = await run_applescript(script, name)
     if result and result != "not found":
-        parts = result.split(",", 2)
-        return {"name": parts[0], "body": parts[1] if len(parts) > 1 else "", "completed": parts[2] == "true" if len(parts) > 2 else False}
+        parts = result.split("\x1f")
+        if len(parts) >= 3:
+            return {"name": parts[0], "body": "\x1f".join(parts[1:-1]), "completed": parts[-1] == "true"}
     return None
 
-def done(name: str):
+async def done(name: str):
     """
     リマインダーを完了済みにマークする。
 
@@ -98,21 +688,26 @@ def done(name: str):
     Returns:
         操作結果
     """
-    script = f'''
-    tell application "Reminders"
-        set matchingReminders to (reminders whose name is "{name}")
-        if (count of matchingReminders) > 0 then
-            set r to item 1 of matchingReminders
-            set completed of r to true
-            return "completed"
-        else
-            return "not found"
-        end if
-    end tell
+    _validate_text(name, "name")
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_done, name)
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set i to my findIndex(item 1 of argv, nameList, completed of every reminder)
+            if i > 0 then
+                set completed of reminder id (item i of (id of every reminder)) to true
+                return "completed"
+            else
+                return "not found"
+            end if
+        end tell
+    end run
     '''
-    return run_applescript(script) == "completed"
+    return await run_applescript(script, name) == "completed"
 
-def delete(name: str):
+async def delete(name: str):
     """
     リマインダーを削除する。
 
@@ -122,20 +717,26 @@ def delete(name: str):
     Returns:
         操作結果
     """
-    script = f'''
-    tell application "Reminders"
-        set matchingReminders to (reminders whose name is "{name}")
-        if (count of matchingReminders) > 0 then
-            delete item 1 of matchingReminders
-            return "deleted"
-        else
-            return "not found"
-        end if
-    end tell
+    _validate_text(name, "name")
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_delete, name)
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set i to my findIndex(item 1 of argv, nameList, missing value)
+            if i > 0 then
+                delete reminder id (item i of (id of every reminder))
+                return "deleted"
+            else
+                return "not found"
+            end if
+        end tell
+    end run
     '''
-    return run_applescript(script) == "deleted"
+    return await run_applescript(script, name) == "deleted"
 
-def update(old_name: str, new_name: str):
+async def update(old_name: str, new_name: str):
     """
     リマインダー名を更新する。
 
@@ -146,21 +747,27 @@ def update(old_name: str, new_name: str):
     Returns:
         操作結果
     """
-    script = f'''
-    tell application "Reminders"
-        set matchingReminders to (reminders whose name is "{old_name}")
-        if (count of matchingReminders) > 0 then
-            set r to item 1 of matchingReminders
-            set name of r to "{new_name}"
-            return "updated"
-        else
-            return "not found"
-        end if
-    end tell
+    _validate_text(old_name, "old_name")
+    _validate_text(new_name, "new_name")
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_update, old_name, new_name)
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set i to my findIndex(item 1 of argv, nameList, missing value)
+            if i > 0 then
+                set name of reminder id (item i of (id of every reminder)) to item 2 of argv
+                return "updated"
+            else
+                return "not found"
+            end if
+        end tell
+    end run
     '''
-    return run_applescript(script) == "updated"
+    return await run_applescript(script, old_name, new_name) == "updated"
 
-def add(name: str, body: str = ""):
+async def add(name: str, body: str = ""):
     """
     新しいリマインダーを追加する。
 
@@ -171,50 +778,265 @@ def add(name: str, body: str = ""):
     Returns:
         操作結果
     """
-    script = f'''
-    tell application "Reminders"
-        set defaultList to first list
-        tell defaultList
-            make new reminder with properties {{name:"{name}", body:"{body}"}}
-            return "added"
+    _validate_text(name, "name")
+    _validate_text(body, "body", multiline=True)
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_add, name, body)
+    script = '''
+    on run argv
+        tell application "Reminders"
+            set defaultList to first list
+            tell defaultList
+                make new reminder with properties {name:item 1 of argv, body:item 2 of argv}
+                return "added"
+            end tell
         end tell
-    end tell
+    end run
     '''
-    return run_applescript(script) == "added"
+    return await run_applescript(script, name, body) == "added"
+
+def _parse_batch_result(count, result):
+    """バッチ処理のAppleScriptが返した "1"/"0" の並びを成否のリストに変換する。"""
+    flags = result.split(", ") if result else []
+    if len(flags) != count:
+        return [False] * count
+    return [flag == "1" for flag in flags]
+
+def _batch_results(names, flags):
+    """名前と成否の並びを、指定した順の [{"name": 名前, "result": 成否}] に変換する。"""
+    return [{"name": name, "result": flag} for name, flag in zip(names, flags)]
+
+async def get_many(names: List[str]):
+    """
+    複数のリマインダーの詳細を並行して取得する。
+
+    AppleScriptの場合はリマインダーごとのスクリプトを別々のosascriptプロセスで同時に実行する
+    (同時実行数は run_applescript 側で制限される)。
+
+    Args:
+        names: リマインダー名のリスト
+
+    Returns:
+        リマインダー名ごとの詳細情報 (見つからない場合はNone)
+    """
+    for name in names:
+        _validate_text(name, "names")
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_get_many, names)
+    async with asyncio.TaskGroup() as tg:
+        tasks = {name: tg.create_task(get(name)) for name in names}
+    return {name: task.result() for name, task in tasks.items()}
+
+async def done_many(names: List[str]):
+    """
+    複数のリマインダーを1回のAppleScript実行でまとめて完了済みにマークする。
+
+    同じ名前を複数回指定した場合は、同名の未完了のリマインダーを1件ずつ順に処理する。
+
+    Args:
+        names: リマインダー名のリスト
+
+    Returns:
+        指定した順の {"name": リマインダー名, "result": 操作結果} のリスト
+    """
+    for name in names:
+        _validate_text(name, "names")
+    if not names:
+        return []
+    if USE_EVENTKIT:
+        return _batch_results(names, await _run_eventkit(_ek_done_many, names))
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set idList to id of every reminder
+            set completedList to completed of every reminder
+            set results to {}
+            repeat with n in argv
+                set i to my findIndex(contents of n, nameList, completedList)
+                if i > 0 then
+                    set completed of reminder id (item i of idList) to true
+                    set item i of completedList to true
+                    set end of results to "1"
+                else
+                    set end of results to "0"
+                end if
+            end repeat
+            return results
+        end tell
+    end run
+    '''
+    return _batch_results(names, _parse_batch_result(len(names), await run_applescript(script, *names)))
+
+async def delete_many(names: List[str]):
+    """
+    複数のリマインダーを1回のAppleScript実行でまとめて削除する。
+
+    同じ名前を複数回指定した場合は、同名のリマインダーを1件ずつ順に処理する。
+
+    Args:
+        names: リマインダー名のリスト
+
+    Returns:
+        指定した順の {"name": リマインダー名, "result": 操作結果} のリスト
+    """
+    for name in names:
+        _validate_text(name, "names")
+    if not names:
+        return []
+    if USE_EVENTKIT:
+        return _batch_results(names, await _run_eventkit(_ek_delete_many, names))
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set idList to id of every reminder
+            set results to {}
+            repeat with n in argv
+                set i to my findIndex(contents of n, nameList, missing value)
+                if i > 0 then
+                    delete reminder id (item i of idList)
+                    set item i of nameList to missing value
+                    set end of results to "1"
+                else
+                    set end of results to "0"
+                end if
+            end repeat
+            return results
+        end tell
+    end run
+    '''
+    return _batch_results(names, _parse_batch_result(len(names), await run_applescript(script, *names)))
+
+async def update_many(updates: Dict[str, str]):
+    """
+    複数のリマインダー名を1回のAppleScript実行でまとめて更新する。
+
+    Args:
+        updates: 現在の名前をキー、新しい名前を値とする辞書
+
+    Returns:
+        現在のリマインダー名ごとの操作結果
+    """
+    for old_name, new_name in updates.items():
+        _validate_text(old_name, "updates")
+        _validate_text(new_name, "updates")
+    if not updates:
+        return {}
+    if USE_EVENTKIT:
+        return dict(zip(updates, await _run_eventkit(_ek_update_many, updates)))
+    # 引数は 現在の名前, 新しい名前, 現在の名前, ... の順に渡す
+    script = _FIND_INDEX_HANDLER + '''
+    on run argv
+        tell application "Reminders"
+            set nameList to name of every reminder
+            set idList to id of every reminder
+            set results to {}
+            repeat with j from 1 to count of argv by 2
+                set i to my findIndex(item j of argv, nameList, missing value)
+                if i > 0 then
+                    set name of reminder id (item i of idList) to item (j + 1) of argv
+                    set item i of nameList to missing value
+                    set end of results to "1"
+                else
+                    set end of results to "0"
+                end if
+            end repeat
+            return results
+        end tell
+    end run
+    '''
+    args = [value for pair in updates.items() for value in pair]
+    return dict(zip(updates, _parse_batch_result(len(updates), await run_applescript(script, *args))))
 
 # カレンダー関連の関数 (新機能)
-def get_calendars():
+# get_calendars() の結果をキャッシュする秒数
+_CALENDARS_TTL = 300
+_calendars_cache = {"value": None, "ts": 0.0}
+
+async def get_calendars():
     """
     利用可能なカレンダーの一覧を取得する。
 
+    カレンダーの一覧はほとんど変わらないため、取得結果を一定時間キャッシュする。
+
+    Returns:
+        カレンダー名のリスト
+    """
+    if _calendars_cache["value"] is not None and time.monotonic() - _calendars_cache["ts"] < _CALENDARS_TTL:
+        return _calendars_cache["value"]
+    calendars = await _fetch_calendars()
+    if calendars:
+        _calendars_cache["value"] = calendars
+        _calendars_cache["ts"] = time.monotonic()
+    return calendars
+
+async def _fetch_calendars():
+    """
+    カレンダーアプリから利用可能なカレンダーの一覧を取得する。
+
     Returns:
         カレンダー名のリスト
     """
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_get_calendars)
+    # カレンダー名をタブ区切りの1つの文字列として受け取り、Python側で分割する
     script = '''
     tell application "Calendar"
         set calendarList to name of every calendar
-        set jsonList to "["
-        repeat with i from 1 to count of calendarList
-            set calName to item i of calendarList
-            set jsonList to jsonList & "\\"" & calName & "\\""
-            if i < count of calendarList then
-                set jsonList to jsonList & ", "
-            end if
-        end repeat
-        set jsonList to jsonList & "]"
-        return jsonList
     end tell
+    set AppleScript's text item delimiters to tab
+    return calendarList as string
     '''
-    result = run_applescript(script)
+    result = await run_applescript(script)
     if result:
-        try:
-            return json.loads(result)
-        except json.JSONDecodeError:
-            print(f"Failed to parse JSON: {result}")
-            return []
+        return result.split("\t")
     return []
 
-def create_calendar_event(title, start_date, end_date, calendar_name=None, location="", notes=""):
+# AppleScriptで日付を組み立てるハンドラ。
+# 日を先に1にしておき、現在日付の日が新しい月に存在しない場合に月がずれるのを防ぐ。
+_MAKE_DATE_HANDLER = '''
+on makeDate(y, m, d, t)
+    set theDate to current date
+    set day of theDate to 1
+    set year of theDate to y as integer
+    set month of theDate to m as integer
+    set day of theDate to d as integer
+    set time of theDate to t as integer
+    return theDate
+end makeDate
+'''
+
+# イベントを作成するAppleScript。日付は _applescript_date_args() の形式で受け取る。
+_CREATE_EVENT_SCRIPT = _MAKE_DATE_HANDLER + '''
+on run argv
+    set {calName, eventTitle, eventLoc, eventNotes, startYear, startMonth, startDay, startTime, endYear, endMonth, endDay, endTime} to argv
+    set startDate to makeDate(startYear, startMonth, startDay, startTime)
+    set endDate to makeDate(endYear, endMonth, endDay, endTime)
+    tell application "Calendar"
+        tell calendar calName
+            make new event with properties {summary:eventTitle, start date:startDate, end date:endDate, location:eventLoc, description:eventNotes}
+            return "Event created successfully in " & calName & " from " & (startDate as string) & " to " & (endDate as string)
+        end tell
+    end tell
+end run
+'''
+
+def _applescript_date_args(dt: datetime.datetime):
+    """
+    datetimeをmakeDateハンドラに渡す引数 (年, 月, 日, 0時からの秒数) に変換する。
+
+    秒は切り捨てる。
+
+    Args:
+        dt: 変換するdatetime
+
+    Returns:
+        (年, 月, 日, 0時からの秒数) のタプル
+    """
+    return dt.year, dt.month, dt.day, dt.hour * 3600 + dt.minute * 60
+
+async def create_calendar_event(title, start_date, end_date, calendar_name=None, location="", notes=""):
     """
     カレンダーにイベントを作成する。
 
@@ -229,69 +1051,36 @@ def create_calendar_event(title, start_date, end_date, calendar_name=None, locat
     Returns:
         成功時はTrue、失敗時はFalse
     """
+    _validate_text(title, "title")
+    _validate_text(location, "location")
+    _validate_text(notes, "notes", multiline=True)
+    if calendar_name is not None:
+        _validate_text(calendar_name, "calendar_name")
     if calendar_name is None:
-        calendars = get_calendars()
+        calendars = await get_calendars()
         if calendars:
             calendar_name = calendars[0]
         else:
             return False
 
-    # ISO形式の日付文字列をAppleScriptで扱える形式に変換
+    # ISO形式の日付文字列をdatetimeオブジェクトに変換
     try:
         start_date_obj = datetime.datetime.fromisoformat(start_date)
         end_date_obj = datetime.datetime.fromisoformat(end_date)
-        
-        # 日付のコンポーネントを取得
-        start_year = start_date_obj.year
-        start_month = start_date_obj.month
-        start_day = start_date_obj.day
-        start_hour = start_date_obj.hour
-        start_minute = start_date_obj.minute
-        
-        end_year = end_date_obj.year
-        end_month = end_date_obj.month
-        end_day = end_date_obj.day
-        end_hour = end_date_obj.hour
-        end_minute = end_date_obj.minute
-        
-        print(f"Creating event: {title} from {start_date_obj} to {end_date_obj} in calendar '{calendar_name}'")
+        logger.debug("Creating event: %s from %s to %s in calendar '%s'", title, start_date_obj, end_date_obj, calendar_name)
     except ValueError:
-        print(f"Invalid date format: start_date={start_date}, end_date={end_date}")
+        logger.warning("Invalid date format: start_date=%s, end_date=%s", start_date, end_date)
         return False
 
-    # AppleScriptで日付コンポーネントを直接設定
-    script = f'''
-    tell application "Calendar"
-        tell calendar "{calendar_name}"
-            -- 開始日時の設定
-            set startDate to current date
-            set year of startDate to {start_year}
-            set month of startDate to {start_month}
-            set day of startDate to {start_day}
-            set hours of startDate to {start_hour}
-            set minutes of startDate to {start_minute}
-            set seconds of startDate to 0
-            
-            -- 終了日時の設定
-            set endDate to current date
-            set year of endDate to {end_year}
-            set month of endDate to {end_month}
-            set day of endDate to {end_day}
-            set hours of endDate to {end_hour}
-            set minutes of endDate to {end_minute}
-            set seconds of endDate to 0
-            
-            -- イベントの作成
-            make new event with properties {{summary:"{title}", start date:startDate, end date:endDate, location:"{location}", description:"{notes}"}}
-            return "Event created successfully in {calendar_name} from " & (startDate as string) & " to " & (endDate as string)
-        end tell
-    end tell
-    '''
-    result = run_applescript(script)
-    print(f"AppleScript result: {result}")  # デバッグ用
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_create_calendar_event, title, start_date_obj, end_date_obj, calendar_name, location, notes)
+
+    result = await run_applescript(_CREATE_EVENT_SCRIPT, calendar_name, title, location, notes,
+                                   *_applescript_date_args(start_date_obj), *_applescript_date_args(end_date_obj))
+    logger.debug("AppleScript result: %s", result)
     return result is not None and "successfully" in result
 
-def get_calendar_events(start_date, end_date, calendar_name=None):
+async def get_calendar_events(start_date, end_date, calendar_name=None):
     """
     指定した期間のイベントを取得する。
 
@@ -303,8 +1092,10 @@ def get_calendar_events(start_date, end_date, calendar_name=None):
     Returns:
         イベント情報の辞書のリスト
     """
+    if calendar_name is not None:
+        _validate_text(calendar_name, "calendar_name")
     if calendar_name is None:
-        calendars = get_calendars()
+        calendars = await get_calendars()
         if calendars:
             calendar_name = calendars[0]
         else:
@@ -314,91 +1105,104 @@ def get_calendar_events(start_date, end_date, calendar_name=None):
     try:
         start_date_obj = datetime.datetime.fromisoformat(start_date)
         end_date_obj = datetime.datetime.fromisoformat(end_date)
-        
-        # 日付のコンポーネントを取得
-        start_year = start_date_obj.year
-        start_month = start_date_obj.month
-        start_day = start_date_obj.day
-        
-        end_year = end_date_obj.year
-        end_month = end_date_obj.month
-        end_day = end_date_obj.day
-        
-        print(f"Searching for events from {start_date_obj.date()} to {end_date_obj.date()} in calendar '{calendar_name}'")
+        logger.debug("Searching for events from %s to %s in calendar '%s'", start_date_obj.date(), end_date_obj.date(), calendar_name)
     except ValueError:
-        print(f"Invalid date format: start_date={start_date}, end_date={end_date}")
+        logger.warning("Invalid date format: start_date=%s, end_date=%s", start_date, end_date)
         return []
 
-    # 日付範囲を指定してイベントを取得するAppleScript
-    script = f'''
-    tell application "Calendar"
-        tell calendar "{calendar_name}"
-            -- 開始日時の設定
-            set startDate to current date
-            set year of startDate to {start_year}
-            set month of startDate to {start_month}
-            set day of startDate to {start_day}
-            set hours of startDate to 0
-            set minutes of startDate to 0
-            set seconds of startDate to 0
-            
-            -- 終了日時の設定
-            set endDate to current date
-            set year of endDate to {end_year}
-            set month of endDate to {end_month}
-            set day of endDate to {end_day}
-            set hours of endDate to 23
-            set minutes of endDate to 59
-            set seconds of endDate to 59
-            
-            -- 日付範囲内のイベントを取得
-            set matchingEvents to (events whose start date ≥ startDate and start date ≤ endDate)
-            
-            set eventData to ""
-            repeat with e in matchingEvents
-                set eventTitle to summary of e
-                set eventStart to start date of e as string
-                set eventEnd to end date of e as string
-                set eventLoc to ""
-                try
-                    set eventLoc to location of e
-                    if eventLoc is missing value then
-                        set eventLoc to ""
-                    end if
-                end try
-                
-                -- 区切り文字として使用しない特殊な文字を使用
-                set eventData to eventData & eventTitle & "§§§" & eventStart & "§§§" & eventEnd & "§§§" & eventLoc & "\\n"
-            end repeat
-            return eventData
+    # 開始日の0時から終了日の23:59:59までに始まるイベントを対象とする
+    range_start = datetime.datetime.combine(start_date_obj.date(), datetime.time.min)
+    range_end = datetime.datetime.combine(end_date_obj.date(), datetime.time(23, 59, 59))
+
+    if USE_EVENTKIT:
+        return await _run_eventkit(_ek_get_calendar_events, range_start, range_end, calendar_name)
+
+    # whose句による日付の絞り込みは非常に遅いため、イベントの属性を一括で取得してPython側で絞り込む。
+    # 日付はロケールに依存しないよう、年・月・日・0時からの秒数に分けて受け取る。
+    # 1件をUS (0x1F) 区切り、イベント間をRS (0x1E) 区切りの文字列として返す。
+    script = '''
+    on run argv
+        tell application "Calendar"
+            tell calendar (item 1 of argv)
+                set titleList to summary of every event
+                set startList to start date of every event
+                set endList to end date of every event
+                set locList to location of every event
+            end tell
         end tell
-    end tell
+        
+        set eventRows to {}
+        set AppleScript's text item delimiters to (character id 31)
+        repeat with i from 1 to count of startList
+            set s to item i of startList
+            set e to item i of endList
+            set eventTitle to item i of titleList
+            if eventTitle is missing value then
+                set eventTitle to ""
+            end if
+            set eventLoc to item i of locList
+            if eventLoc is missing value then
+                set eventLoc to ""
+            end if
+            set end of eventRows to {eventTitle, year of s, (month of s) as integer, day of s, time of s, year of e, (month of e) as integer, day of e, time of e, eventLoc} as string
+        end repeat
+        set AppleScript's text item delimiters to (character id 30)
+        return eventRows as string
+    end run
     '''
-    result = run_applescript(script)
-    print(f"AppleScript result: {result}")  # デバッグ用
+    result = await run_applescript(script, calendar_name)
+    logger.debug("AppleScript result: %s", result)
     
     events = []
+    debug = logger.isEnabledFor(logging.DEBUG)
     
-    if result and result.strip():
-        lines = result.strip().split("\\n")
-        for line in lines:
-            if not line.strip():
+    if result:
+        for row in result.split("\x1e"):
+            parts = row.split("\x1f")
+            if len(parts) < 10:
+                continue
+            try:
+                start = _applescript_datetime(*parts[1:5])
+                end = _applescript_datetime(*parts[5:9])
+            except ValueError:
+                logger.warning("Skipping malformed event row: %r", row)
+                continue
+            if not range_start <= start <= range_end:
                 continue
-            parts = line.split("§§§")
-            if len(parts) >= 3:
-                event = {
-                    "title": parts[0],
-                    "start": parts[1],
-                    "end": parts[2],
-                    "location": parts[3] if len(parts) > 3 else ""
-                }
-                events.append(event)
-                print(f"Event: {event['title']} - {event['start']} to {event['end']}")
+            event = {
+                "title": parts[0],
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "location": parts[9]
+            }
+            events.append(event)
+            if debug:
+                logger.debug("Event: %s - %s to %s", event["title"], event["start"], event["end"])
+    events.sort(key=lambda event: event["start"])
     
-    print(f"Found {len(events)} events in calendar '{calendar_name}' from {start_date_obj.date()} to {end_date_obj.date()}")
+    logger.debug("Found %d events in calendar '%s' from %s to %s", len(events), calendar_name, start_date_obj.date(), end_date_obj.date())
     return events
 
+def _applescript_datetime(year, month, day, seconds):
+    """
+    AppleScriptの日付から取り出した値をdatetimeに変換する。
+
+    Args:
+        year: 年
+        month: 月
+        day: 日
+        seconds: 0時からの秒数
+
+    Returns:
+        datetimeオブジェクト
+    """
+    return datetime.datetime(int(year), int(month), int(day)) + datetime.timedelta(seconds=int(seconds))
+
 # 時間関連の関数 (新機能)
+# 曜日名 (datetime.weekday() の値で引く)
+_WEEKDAY_EN = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_WEEKDAY_JP = ("月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日")
+
 def get_current_time():
     """
     現在の時刻を取得する。
@@ -407,75 +1211,182 @@ def get_current_time():
         現在の時刻情報を含む辞書
     """
     now = datetime.datetime.now()
+    weekday = now.weekday()
     return {
         "iso_format": now.isoformat(),
-        "formatted": now.strftime("%Y年%m月%d日 %H時%M分%S秒"),
+        "formatted": f"{now.year:04d}年{now.month:02d}月{now.day:02d}日 {now.hour:02d}時{now.minute:02d}分{now.second:02d}秒",
         "year": now.year,
         "month": now.month,
         "day": now.day,
         "hour": now.hour,
         "minute": now.minute,
         "second": now.second,
-        "weekday": now.strftime("%A"),
-        "weekday_jp": ["月曜日", "火曜日", "水曜日", "木曜日", "金曜日", "土曜日", "日曜日"][now.weekday()]
+        "weekday": _WEEKDAY_EN[weekday],
+        "weekday_jp": _WEEKDAY_JP[weekday]
     }
 
+# 読み取り系MCPツールの応答キャッシュ
+_RESPONSE_CACHE_TTL = 5
+_RESPONSE_CACHE_MAXSIZE = 512
+_response_cache = {}
+# 更新系ツールが完了するたびに増える世代番号。
+# 更新の前に始まった読み取りの結果をキャッシュに保存しないために使う。
+_response_cache_generation = 0
+
+def _invalidate_response_cache():
+    """応答キャッシュを破棄し、世代番号を進める。"""
+    global _response_cache_generation
+    _response_cache_generation += 1
+    _response_cache.clear()
+
+def ttl_cache(seconds: float = _RESPONSE_CACHE_TTL):
+    """
+    MCPツールの応答を (ツール名, 引数) をキーとして一定時間キャッシュするデコレータ。
+
+    エージェントは同じ引数で読み取り系ツールを短時間に繰り返し呼ぶことが多いため、
+    キャッシュが有効な間はAppleScriptやEventKitを呼び出さずに前回の応答を返す。
+    更新系ツールは invalidates_cache で完了後にキャッシュを無効化する。
+    実行中に更新が完了した場合、古い可能性がある結果はキャッシュに保存しない。
+
+    Args:
+        seconds: キャッシュの有効秒数
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__, json.dumps([args, kwargs], sort_keys=True, default=str))
+            entry = _response_cache.pop(key, None)
+            if entry is not None and time.monotonic() - entry[0] < seconds:
+                _response_cache[key] = entry
+                return entry[1]
+            generation = _response_cache_generation
+            result = await func(*args, **kwargs)
+            if generation != _response_cache_generation:
+                return result
+            if len(_response_cache) >= _RESPONSE_CACHE_MAXSIZE:
+                del _response_cache[next(iter(_response_cache))]
+            _response_cache[key] = (time.monotonic(), result)
+            return result
+        return wrapper
+    return decorator
+
+def invalidates_cache(func):
+    """
+    更新系MCPツールの完了後 (失敗した場合も含む) に応答キャッシュを無効化するデコレータ。
+
+    更新の前に破棄すると、更新中に完了した読み取りが古い結果を保存してしまうため、
+    更新が終わってから破棄する。
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _invalidate_response_cache()
+    return wrapper
+
 # MCPサーバーの設定
-mcp = FastMCP()
-
-@mcp.tool("list_reminders")
-async def list_reminders_mcp():
-    """未完了のリマインダー一覧を取得します。"""
-    return {"reminders": list_reminders()}
-
-@mcp.tool("get_reminder")
-async def get_reminder(name: str):
-    """特定のリマインダーの詳細を取得します。"""
-    return {"result": get(name)}
-
-@mcp.tool("complete_reminder")
-async def complete_reminder(name: str):
-    """リマインダーを完了済みにマークします。"""
-    return {"result": done(name)}
-
-@mcp.tool("delete_reminder")
-async def delete_reminder(name: str):
-    """リマインダーを削除します。"""
-    return {"result": delete(name)}
-
-@mcp.tool("update_reminder")
-async def update_reminder(old_name: str, new_name: str):
-    """リマインダーの名前を更新します。"""
-    return {"result": update(old_name, new_name)}
-
-@mcp.tool("add_reminder")
-async def add_reminder(name: str, body: str = ""):
-    """新しいリマインダーを追加します。"""
-    return {"result": add(name, body)}
-
-# カレンダー関連のMCPツール (新機能)
-@mcp.tool("list_calendars")
-async def list_calendars_mcp():
-    """利用可能なカレンダーの一覧を取得します。"""
-    return {"calendars": get_calendars()}
-
-@mcp.tool("create_calendar_event")
-async def create_calendar_event_mcp(title: str, start_date: str, end_date: str, calendar_name=None, location: str = "", notes: str = ""):
-    """カレンダーにイベントを作成します。"""
-    success = create_calendar_event(title, start_date, end_date, calendar_name, location, notes)
-    return {"result": "Event created successfully" if success else "Failed to create event"}
-
-@mcp.tool("get_calendar_events")
-async def get_calendar_events_mcp(start_date: str, end_date: str, calendar_name=None):
-    """指定した期間のカレンダーイベントを取得します。"""
-    events = get_calendar_events(start_date, end_date, calendar_name)
-    return {"events": events}
-
-# 時間関連のMCPツール (新機能)
-@mcp.tool("get_current_time")
-async def get_current_time_mcp():
-    """現在時刻を取得します。"""
-    return get_current_time()
+def build_app():
+    """
+    MCPサーバーを作成し、ツールを登録する。
+
+    モジュールをインポートしただけではサーバーを作成しないよう、
+    mcp_serve() から呼び出す。
+
+    Returns:
+        ツールを登録したFastMCPインスタンス
+    """
+    from mcp.server.fastmcp import FastMCP
+
+    mcp = FastMCP()
+
+    @mcp.tool("list_reminders")
+    @ttl_cache()
+    async def list_reminders_mcp():
+        """未完了のリマインダー一覧を取得します。"""
+        return {"reminders": await list_reminders()}
+
+    @mcp.tool("get_reminder")
+    @ttl_cache()
+    async def get_reminder(name: str):
+        """特定のリマインダーの詳細を取得します。"""
+        return {"result": await get(name)}
+
+    @mcp.tool("complete_reminder")
+    @invalidates_cache
+    async def complete_reminder(name: str):
+        """リマインダーを完了済みにマークします。"""
+        return {"result": await done(name)}
+
+    @mcp.tool("delete_reminder")
+    @invalidates_cache
+    async def delete_reminder(name: str):
+        """リマインダーを削除します。"""
+        return {"result": await delete(name)}
+
+    @mcp.tool("update_reminder")
+    @invalidates_cache
+    async def update_reminder(old_name: str, new_name: str):
+        """リマインダーの名前を更新します。"""
+        return {"result": await update(old_name, new_name)}
+
+    @mcp.tool("add_reminder")
+    @invalidates_cache
+    async def add_reminder(name: str, body: str = ""):
+        """新しいリマインダーを追加します。"""
+        return {"result": await add(name, body)}
+
+    @mcp.tool("get_reminders_bulk")
+    @ttl_cache()
+    async def get_reminders_bulk(names: List[str]):
+        """複数のリマインダーの詳細をまとめて取得します。"""
+        return {"results": await get_many(names)}
+
+    @mcp.tool("complete_reminders")
+    @invalidates_cache
+    async def complete_reminders(names: List[str]):
+        """複数のリマインダーをまとめて完了済みにマークします。同じ名前を複数回指定すると、同名の未完了のリマインダーを1件ずつ順に処理します。結果は指定した順に返します。"""
+        return {"results": await done_many(names)}
+
+    @mcp.tool("delete_reminders")
+    @invalidates_cache
+    async def delete_reminders(names: List[str]):
+        """複数のリマインダーをまとめて削除します。同じ名前を複数回指定すると、同名のリマインダーを1件ずつ順に処理します。結果は指定した順に返します。"""
+        return {"results": await delete_many(names)}
+
+    @mcp.tool("update_reminders")
+    @invalidates_cache
+    async def update_reminders(updates: Dict[str, str]):
+        """複数のリマインダーの名前をまとめて更新します（キーが現在の名前、値が新しい名前）。"""
+        return {"results": await update_many(updates)}
+
+    # カレンダー関連のMCPツール (新機能)
+    @mcp.tool("list_calendars")
+    async def list_calendars_mcp():
+        """利用可能なカレンダーの一覧を取得します。"""
+        return {"calendars": await get_calendars()}
+
+    @mcp.tool("create_calendar_event")
+    @invalidates_cache
+    async def create_calendar_event_mcp(title: str, start_date: str, end_date: str, calendar_name=None, location: str = "", notes: str = ""):
+        """カレンダーにイベントを作成します。"""
+        success = await create_calendar_event(title, start_date, end_date, calendar_name, location, notes)
+        return {"result": "Event created successfully" if success else "Failed to create event"}
+
+    @mcp.tool("get_calendar_events")
+    @ttl_cache()
+    async def get_calendar_events_mcp(start_date: str, end_date: str, calendar_name=None):
+        """指定した期間のカレンダーイベントを取得します。"""
+        events = await get_calendar_events(start_date, end_date, calendar_name)
+        return {"events": events}
+
+    # 時間関連のMCPツール (新機能)
+    @mcp.tool("get_current_time")
+    async def get_current_time_mcp():
+        """現在時刻を取得します。"""
+        return get_current_time()
+
+    return mcp
 
 def mcp_serve(port: int = 2501):
     """
@@ -487,7 +1398,9 @@ def mcp_serve(port: int = 2501):
     # FastMCPのrunメソッドはportパラメータを直接受け取らないため、
     # sys.argvを使用してポート番号を設定
     sys.argv = ["reminder_mcp.py", "--port", str(port)]
-    mcp.run()
+    if not USE_EVENTKIT:
+        warm_up_sessions()
+    build_app().run()
 
 if __name__ == "__main__":
     import argparse